@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Fail when importing the CLI or service exceeds the startup budget.
+
+Each module is imported in a fresh interpreter several times; the fastest
+import must stay within its budget and must not have loaded any of the
+heavy rendering dependencies (those belong to the render path only).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import List, Sequence
+
+HEAVY_MODULES = ("moviepy", "numpy", "PIL", "imageio_ffmpeg")
+# Flask itself accounts for most of the service's budget.
+DEFAULT_BUDGETS_MS = {"img2vid.cli": 150.0, "img2vid.flask_app": 500.0}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+__import__({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _probe(module: str, runs: int) -> tuple[float, List[str]]:
+    best = float("inf")
+    loaded: List[str] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        best = min(best, result["ms"])
+        loaded = result["loaded"]
+    return best, loaded
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_BUDGETS_MS))
+    parser.add_argument(
+        "--budget-ms", type=float, help="Override the per-module default budget"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        budget = args.budget_ms or DEFAULT_BUDGETS_MS.get(module, 150.0)
+        elapsed, loaded = _probe(module, args.runs)
+        status = "ok"
+        if elapsed > budget or loaded:
+            status = "FAIL"
+            failed = True
+        heavy = f" (loaded {', '.join(loaded)})" if loaded else ""
+        print(f"{status:4} {module}: {elapsed:.1f} ms / {budget:.0f} ms{heavy}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
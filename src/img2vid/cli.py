@@ -9,115 +9,9 @@ import sys
 from pathlib import Path
 from typing import Iterable, Optional
 
-from .converter import (
-    DEFAULT_FRAME_RATE,
-    DEFAULT_TEXT_DURATION_MS,
-    ConversionConfig,
-    ConversionError,
-    render_video,
-    resolve_output_path,
-)
-
-
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="img2vid",
-        description=(
-            "Convert an ordered folder of images into an MP4 slideshow with optional audio"
-        ),
-    )
-    parser.add_argument(
-        "--input-dir",
-        type=Path,
-        required=True,
-        help="Directory containing the source images",
-    )
-    parser.add_argument(
-        "--output-video",
-        type=Path,
-        help="Explicit target path for the generated video",
-    )
-    parser.add_argument(
-        "--output-dir",
-        type=Path,
-        default=Path("build"),
-        help="Root folder where versioned outputs are stored (default: build)",
-    )
-    parser.add_argument(
-        "--output-name",
-        type=str,
-        help="Base filename (without extension) for the generated video",
-    )
-    parser.add_argument(
-        "--audio",
-        type=Path,
-        help="Optional soundtrack to merge with the slideshow",
-    )
-    parser.add_argument(
-        "--frame-duration-ms",
-        type=int,
-        default=3000,
-        help="Duration each image remains on screen (milliseconds)",
-    )
-    parser.add_argument(
-        "--transition-ms",
-        type=int,
-        default=500,
-        help="Cross-fade duration between images (milliseconds)",
-    )
-    parser.add_argument(
-        "--frame-rate",
-        type=int,
-        default=DEFAULT_FRAME_RATE,
-        help="Frames per second for the final video (default: %(default)s)",
-    )
-    parser.add_argument(
-        "--start-text",
-        type=str,
-        help="Optional opening title text overlay",
-    )
-    parser.add_argument(
-        "--end-text",
-        type=str,
-        help="Optional closing credits text overlay",
-    )
-    parser.add_argument(
-        "--text-duration-ms",
-        type=int,
-        default=DEFAULT_TEXT_DURATION_MS,
-        help="Duration for title/credits overlays (milliseconds)",
-    )
-    parser.add_argument(
-        "--text-font",
-        type=str,
-        help="Path to a TTF/OTF font for overlay text",
-    )
-    parser.add_argument(
-        "--text-font-size",
-        type=int,
-        default=54,
-        help="Font size for overlay text",
-    )
-    parser.add_argument(
-        "--text-color",
-        type=str,
-        default="white",
-        help="Text color (name or hex) for overlays",
-    )
-    parser.add_argument(
-        "--text-bg-color",
-        type=str,
-        default="#000000",
-        help="Background color (name or hex) for overlays",
-    )
-    parser.add_argument(
-        "--log-level",
-        type=str,
-        default="INFO",
-        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
-        help="Logging verbosity",
-    )
-    return parser
+from . import converter
+from .cli_args import build_parser, check_inputs
+from .converter import ConversionConfig, ConversionError, resolve_output_path
 
 
 def _configure_logging(level: str) -> None:
@@ -127,35 +21,15 @@ def _configure_logging(level: str) -> None:
     )
 
 
-def main(argv: Optional[Iterable[str]] = None) -> int:
-    parser = _build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
-
-    _configure_logging(args.log_level)
-    logging.info("Starting conversion run")
-
-    def _handle_termination(signum, _frame):
-        raise KeyboardInterrupt
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        try:
-            signal.signal(sig, _handle_termination)
-        except (ValueError, OSError):  # pragma: no cover - not supported on all platforms
-            continue
-
-    output_video = resolve_output_path(
-        input_dir=args.input_dir,
-        explicit_output=args.output_video,
-        output_root=args.output_dir,
-        output_basename=args.output_name,
-    )
-
-    config = ConversionConfig(
+def _config_from_args(args: argparse.Namespace, output_video: Path) -> ConversionConfig:
+    return ConversionConfig(
         input_dir=args.input_dir,
         output_video=output_video,
         audio_path=args.audio,
         frame_duration_ms=args.frame_duration_ms,
         transition_ms=args.transition_ms,
+        transition=args.transition,
+        transition_sequence=args.transition_sequence,
         frame_rate=args.frame_rate,
         start_text=args.start_text,
         end_text=args.end_text,
@@ -164,12 +38,53 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         text_font_size=args.text_font_size,
         text_color=args.text_color,
         text_bg_color=args.text_bg_color,
+        stream_output=args.stream,
+        segment_seconds=args.segment_seconds,
+        checkpoint_seconds=args.checkpoint_seconds,
+        canvas_width=args.canvas_width,
+        canvas_height=args.canvas_height,
+        fit_mode=args.fit_mode,
+        background_color=args.background_color,
     )
 
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    _configure_logging(args.log_level)
+
+    def _handle_termination(signum, _frame):
+        raise KeyboardInterrupt
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(sig, _handle_termination)
+        except (ValueError, OSError):  # pragma: no cover - not supported on all platforms
+            continue
+
+    if args.check:
+        # Checks never reserve a v### folder; the target path is not used.
+        output_video = args.output_video or args.output_dir
+    else:
+        logging.info("Starting conversion run")
+        output_video = resolve_output_path(
+            input_dir=args.input_dir,
+            explicit_output=args.output_video,
+            output_root=args.output_dir,
+            output_basename=args.output_name,
+        )
+
+    config = _config_from_args(args, output_video)
+    if args.check:
+        return check_inputs(config)
+
     try:
-        output_path = render_video(config)
+        output_path = converter.render_video(config)
     except KeyboardInterrupt:
         logging.warning("Render cancelled by user")
+        if config.checkpoint_seconds is not None:
+            logging.warning("Completed chunks were kept; rerun the same command to resume")
         return 130
     except ConversionError as exc:
         logging.error("Conversion failed: %s", exc)
@@ -0,0 +1,194 @@
+"""Argument parsing and validate-only checks for the ``img2vid`` CLI."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+
+from .converter import (
+    DEFAULT_FRAME_RATE,
+    DEFAULT_SEGMENT_SECONDS,
+    DEFAULT_TEXT_DURATION_MS,
+    FIT_MODES,
+    TRANSITIONS,
+    ConversionConfig,
+    ConversionError,
+    estimate_job_cost,
+    list_image_files,
+)
+
+
+def _transition_list(value: str) -> tuple[str, ...]:
+    return tuple(name.strip() for name in value.split(",") if name.strip())
+
+
+def _add_io_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("input and output")
+    group.add_argument(
+        "--input-dir", type=Path, required=True, help="Directory containing the source images"
+    )
+    group.add_argument(
+        "--output-video", type=Path, help="Explicit target path for the generated video"
+    )
+    group.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("build"),
+        help="Root folder where versioned outputs are stored (default: build)",
+    )
+    group.add_argument(
+        "--output-name",
+        help="Base filename (without extension) for the generated video",
+    )
+    group.add_argument(
+        "--audio", type=Path, help="Optional soundtrack to merge with the slideshow"
+    )
+
+
+def _add_timing_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("timing and transitions")
+    group.add_argument(
+        "--frame-duration-ms",
+        type=int,
+        default=3000,
+        help="Duration each image remains on screen (milliseconds)",
+    )
+    group.add_argument(
+        "--transition-ms",
+        type=int,
+        default=500,
+        help="Cross-fade duration between images (milliseconds)",
+    )
+    group.add_argument(
+        "--transition",
+        default="crossfade",
+        choices=list(TRANSITIONS),
+        help="Transition style between images (default: %(default)s)",
+    )
+    group.add_argument(
+        "--transition-sequence",
+        type=_transition_list,
+        help="Comma-separated transitions for consecutive image pairs, repeated as needed",
+    )
+    group.add_argument(
+        "--frame-rate",
+        type=int,
+        default=DEFAULT_FRAME_RATE,
+        help="Frames per second for the final video (default: %(default)s)",
+    )
+
+
+def _add_text_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("title and credits")
+    group.add_argument("--start-text", help="Optional opening title text overlay")
+    group.add_argument("--end-text", help="Optional closing credits text overlay")
+    group.add_argument(
+        "--text-duration-ms",
+        type=int,
+        default=DEFAULT_TEXT_DURATION_MS,
+        help="Duration for title/credits overlays (milliseconds)",
+    )
+    group.add_argument("--text-font", help="Path to a TTF/OTF font for overlay text")
+    group.add_argument(
+        "--text-font-size", type=int, default=54, help="Font size for overlay text"
+    )
+    group.add_argument(
+        "--text-color",
+        default="white",
+        help="Text color (name or hex) for overlays",
+    )
+    group.add_argument(
+        "--text-bg-color",
+        default="#000000",
+        help="Background color (name or hex) for overlays",
+    )
+
+
+def _add_canvas_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("canvas")
+    group.add_argument(
+        "--canvas-width", type=int, help="Output frame width; defaults to the widest input image"
+    )
+    group.add_argument(
+        "--canvas-height",
+        type=int,
+        help="Output frame height; defaults to the tallest input image",
+    )
+    group.add_argument(
+        "--fit-mode",
+        default="pad",
+        choices=list(FIT_MODES),
+        help="How images are placed on the canvas (default: %(default)s)",
+    )
+    group.add_argument(
+        "--background-color",
+        default="#000000",
+        help="Color (name or hex) for letterbox/pad borders",
+    )
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("rendering")
+    group.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write HLS segments and a playlist while rendering, then remux to MP4",
+    )
+    group.add_argument(
+        "--segment-seconds",
+        type=float,
+        default=DEFAULT_SEGMENT_SECONDS,
+        help="Target HLS segment length in seconds when streaming (default: %(default)s)",
+    )
+    group.add_argument(
+        "--checkpoint-seconds",
+        type=float,
+        help="Encode in chunks of this many seconds so an interrupted render resumes",
+    )
+    group.add_argument(
+        "--check",
+        action="store_true",
+        help="Validate the config and inputs, then exit without rendering",
+    )
+    group.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="img2vid",
+        description=(
+            "Convert an ordered folder of images into an MP4 slideshow with optional audio"
+        ),
+    )
+    _add_io_arguments(parser)
+    _add_timing_arguments(parser)
+    _add_text_arguments(parser)
+    _add_canvas_arguments(parser)
+    _add_run_arguments(parser)
+    return parser
+
+
+def check_inputs(config: ConversionConfig) -> int:
+    """Validate ``config`` and read image headers without loading MoviePy."""
+
+    try:
+        config.validate()
+        image_files = list_image_files(config.input_dir)
+        cost = estimate_job_cost(config, image_files)
+    except ConversionError as exc:
+        logging.error("Check failed: %s", exc)
+        return 1
+
+    logging.info(
+        "Check passed: %d image(s), %.2f seconds, ~%.0f MiB estimated",
+        len(image_files),
+        cost.duration_seconds,
+        cost.memory_bytes / (1024 * 1024),
+    )
+    return 0
@@ -2,24 +2,56 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
+from . import helpers
 from .helpers import (
     DEFAULT_FRAME_RATE,
+    DEFAULT_SEGMENT_SECONDS,
     DEFAULT_TEXT_DURATION_MS,
+    FIT_MODES,
+    PLAYLIST_NAME,
     SUPPORTED_IMAGE_EXTENSIONS,
+    TRANSITIONS,
+    AdmissionController,
+    AdmissionRejected,
     ConversionConfig,
     ConversionError,
+    JobCost,
+    estimate_job_cost,
     list_image_files,
+    release_output_path,
     resolve_output_path,
-    render_video,
+    stream_directory,
 )
 
+if TYPE_CHECKING:
+    from .helpers.render import render_video
+
 __all__ = [
     "DEFAULT_FRAME_RATE",
+    "DEFAULT_SEGMENT_SECONDS",
     "DEFAULT_TEXT_DURATION_MS",
+    "FIT_MODES",
+    "PLAYLIST_NAME",
     "SUPPORTED_IMAGE_EXTENSIONS",
+    "TRANSITIONS",
+    "AdmissionController",
+    "AdmissionRejected",
     "ConversionConfig",
     "ConversionError",
+    "JobCost",
+    "estimate_job_cost",
     "list_image_files",
+    "release_output_path",
     "resolve_output_path",
     "render_video",
+    "stream_directory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # ``render_video`` loads MoviePy; resolve it only when a render starts.
+    if name == "render_video":
+        return helpers.render_video
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,32 @@
+"""Render-equivalence harness comparing rendering engines frame by frame.
+
+Synthetic fixtures are rendered through a baseline and one or more
+candidate engines; the outputs are decoded and checked for duration,
+frame count and A/V sync, and scored per frame with PSNR and SSIM. Run it
+with ``python -m img2vid.equivalence``.
+"""
+
+from .fixtures import FIXTURES, Fixture, materialize_fixture
+from .harness import (
+    ENGINES,
+    Comparison,
+    Engine,
+    Thresholds,
+    compare_outputs,
+    run_harness,
+)
+from .metrics import psnr, ssim
+
+__all__ = [
+    "ENGINES",
+    "FIXTURES",
+    "Comparison",
+    "Engine",
+    "Fixture",
+    "Thresholds",
+    "compare_outputs",
+    "materialize_fixture",
+    "psnr",
+    "run_harness",
+    "ssim",
+]
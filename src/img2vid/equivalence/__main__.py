@@ -0,0 +1,85 @@
+"""Command-line entry point: ``python -m img2vid.equivalence``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .fixtures import FIXTURES
+from .harness import (
+    DEFAULT_MIN_PSNR,
+    DEFAULT_MIN_SSIM,
+    ENGINES,
+    Thresholds,
+    run_harness,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Render synthetic fixtures through two engines and compare the outputs.",
+    )
+    parser.add_argument("--baseline", choices=sorted(ENGINES), default="render")
+    parser.add_argument(
+        "--candidate",
+        dest="candidates",
+        action="append",
+        choices=sorted(ENGINES),
+        help="Engine to compare against the baseline (repeatable; default: all others)",
+    )
+    parser.add_argument(
+        "--fixture",
+        dest="fixtures",
+        action="append",
+        choices=[fixture.name for fixture in FIXTURES],
+        help="Fixture to render (repeatable; default: all)",
+    )
+    parser.add_argument("--min-psnr", type=float, default=DEFAULT_MIN_PSNR)
+    parser.add_argument("--min-ssim", type=float, default=DEFAULT_MIN_SSIM)
+    parser.add_argument("--work-dir", type=Path, help="Keep renders here instead of a temp dir")
+    parser.add_argument("--report", type=Path, help="Write per-frame metrics as JSON")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("img2vid.helpers").setLevel(logging.WARNING)
+    args = build_parser().parse_args(argv)
+
+    candidates = args.candidates or [name for name in ENGINES if name != args.baseline]
+    fixtures = [f for f in FIXTURES if not args.fixtures or f.name in args.fixtures]
+    thresholds = Thresholds(min_psnr=args.min_psnr, min_ssim=args.min_ssim)
+
+    with tempfile.TemporaryDirectory(prefix="img2vid-equivalence-") as temp_dir:
+        work_dir = args.work_dir or Path(temp_dir)
+        results = run_harness(work_dir, args.baseline, candidates, fixtures, thresholds)
+
+    for result in results:
+        print(result.summary())
+        for failure in result.failures:
+            print(f"    - {failure}")
+
+    if args.report:
+        report = [
+            {
+                "fixture": r.fixture,
+                "engine": r.engine,
+                "passed": r.passed,
+                "failures": r.failures,
+                "psnr": [round(v, 3) if v != float("inf") else None for v in r.psnr_values],
+                "ssim": [round(v, 5) for v in r.ssim_values],
+            }
+            for r in results
+        ]
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
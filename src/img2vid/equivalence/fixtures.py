@@ -0,0 +1,110 @@
+"""Small deterministic fixtures generated on the fly, so the harness runs offline."""
+
+from __future__ import annotations
+
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from ..helpers.config import ConversionConfig
+
+AUDIO_SAMPLE_RATE = 44100
+
+
+@dataclass(frozen=True, slots=True)
+class Fixture:
+    """Inputs and settings for one synthetic slideshow."""
+
+    name: str
+    sizes: Tuple[Tuple[int, int], ...]
+    frame_duration_ms: int = 1000
+    transition_ms: int = 300
+    transition: str = "crossfade"
+    audio_seconds: Optional[float] = 2.0
+    start_text: Optional[str] = None
+    end_text: Optional[str] = None
+    options: dict = field(default_factory=dict)
+
+
+FIXTURES = (
+    Fixture("uniform-crossfade", sizes=((160, 120),) * 3),
+    Fixture(
+        "mixed-letterbox-wipe",
+        sizes=((160, 120), (90, 160), (200, 100)),
+        transition="wipe",
+        audio_seconds=None,
+        options={"fit_mode": "letterbox"},
+    ),
+    Fixture(
+        "titles-slide",
+        sizes=((160, 120), (160, 120)),
+        transition="slide",
+        start_text="Start",
+        end_text="End",
+        audio_seconds=1.5,
+    ),
+    # A 3.1 s timeline whose float duration lands just under 93 frames at
+    # 30 fps: engines must agree on how the partial last frame is counted.
+    Fixture("frame-rounding-edge", sizes=((160, 120),) * 4, audio_seconds=1.0),
+)
+
+
+def _image(index: int, size: Tuple[int, int]) -> Image.Image:
+    # Gradients plus a moving block give every frame texture and motion cues.
+    width, height = size
+    ys, xs = np.mgrid[0:height, 0:width]
+    pixels = np.stack(
+        [
+            (xs * 255 // max(width - 1, 1) + index * 60) % 256,
+            (ys * 255 // max(height - 1, 1) + index * 90) % 256,
+            np.full_like(xs, (index * 85) % 256),
+        ],
+        axis=-1,
+    ).astype(np.uint8)
+    block = max(4, min(width, height) // 4)
+    left = (index * block) % max(width - block, 1)
+    pixels[height // 4 : height // 4 + block, left : left + block] = 255
+    return Image.fromarray(pixels)
+
+
+def _write_tone(path: Path, seconds: float) -> None:
+    samples = np.arange(int(seconds * AUDIO_SAMPLE_RATE)) / AUDIO_SAMPLE_RATE
+    tone = (np.sin(2 * np.pi * 440 * samples) * 8000).astype("<i2")
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(AUDIO_SAMPLE_RATE)
+        handle.writeframes(tone.tobytes())
+
+
+def materialize_fixture(fixture: Fixture, root: Path, output_video: Path) -> ConversionConfig:
+    """Write ``fixture`` inputs under ``root`` and return a config targeting ``output_video``."""
+
+    input_dir = root / fixture.name
+    input_dir.mkdir(parents=True, exist_ok=True)
+    for index, size in enumerate(fixture.sizes):
+        suffix = ".jpg" if index % 2 else ".png"
+        _image(index, size).save(input_dir / f"{index:03d}{suffix}", quality=95)
+
+    audio_path = None
+    if fixture.audio_seconds:
+        audio_path = root / f"{fixture.name}.wav"
+        _write_tone(audio_path, fixture.audio_seconds)
+
+    return ConversionConfig(
+        input_dir=input_dir,
+        output_video=output_video,
+        audio_path=audio_path,
+        frame_duration_ms=fixture.frame_duration_ms,
+        transition_ms=fixture.transition_ms,
+        transition=fixture.transition,
+        start_text=fixture.start_text,
+        end_text=fixture.end_text,
+        text_duration_ms=800,
+        text_font_size=24,
+        **fixture.options,
+    )
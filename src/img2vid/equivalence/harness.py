@@ -0,0 +1,199 @@
+"""Render fixtures through two engines and compare the decoded outputs."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ..helpers.config import ConversionConfig
+from .fixtures import FIXTURES, Fixture, materialize_fixture
+from .metrics import StreamInfo, decode_frames, probe_streams, psnr, ssim
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_PSNR = 35.0
+DEFAULT_MIN_SSIM = 0.97
+
+
+def _render(config: ConversionConfig) -> Path:
+    from ..helpers.render import render_video
+
+    return render_video(config)
+
+
+def _checkpointed(config: ConversionConfig) -> Path:
+    return _render(dataclasses.replace(config, checkpoint_seconds=1.0))
+
+
+def _streaming(config: ConversionConfig) -> Path:
+    return _render(dataclasses.replace(config, stream_output=True, segment_seconds=1.0))
+
+
+@dataclass(frozen=True, slots=True)
+class Engine:
+    """A rendering path under comparison.
+
+    Engines render at the same frame rate from deterministic fixtures, so
+    frame counts must match exactly; ``frame_tolerance`` is an explicit,
+    per-engine allowance for paths that cannot guarantee that.
+    """
+
+    render: Callable[[ConversionConfig], Path]
+    frame_tolerance: int = 0
+
+
+# Engines under comparison; new rendering paths register here by name.
+ENGINES: Dict[str, Engine] = {
+    "render": Engine(_render),
+    "checkpointed": Engine(_checkpointed),
+    "streaming": Engine(_streaming),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Thresholds:
+    """Limits a candidate must stay within to count as equivalent."""
+
+    min_psnr: float = DEFAULT_MIN_PSNR
+    min_ssim: float = DEFAULT_MIN_SSIM
+    sync_tolerance_seconds: float = 0.02
+    audio_tolerance_seconds: float = 0.05
+
+
+@dataclass(slots=True)
+class Comparison:
+    """Result of comparing one candidate render against the baseline."""
+
+    fixture: str
+    engine: str
+    baseline: StreamInfo
+    candidate: StreamInfo
+    baseline_frames: int = 0
+    candidate_frames: int = 0
+    psnr_values: List[float] = field(default_factory=list)
+    ssim_values: List[float] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def summary(self) -> str:
+        finite = [value for value in self.psnr_values if math.isfinite(value)]
+        min_psnr = min(finite) if finite else math.inf
+        mean_ssim = sum(self.ssim_values) / len(self.ssim_values) if self.ssim_values else 0.0
+        min_ssim = min(self.ssim_values, default=0.0)
+        status = "ok" if self.passed else "FAIL"
+        return (
+            f"{status:4} {self.fixture} [{self.engine}] frames={self.candidate_frames}"
+            f" psnr_min={min_psnr:.2f}dB ssim_min={min_ssim:.4f} ssim_mean={mean_ssim:.4f}"
+        )
+
+
+def compare_outputs(
+    fixture: str,
+    engine: str,
+    baseline_path: Path,
+    candidate_path: Path,
+    frame_rate: int,
+    thresholds: Thresholds,
+    frame_tolerance: int = 0,
+) -> Comparison:
+    """Decode both videos and check timing, A/V sync and per-frame similarity."""
+
+    baseline, candidate = probe_streams(baseline_path), probe_streams(candidate_path)
+    result = Comparison(fixture, engine, baseline, candidate)
+    failures = result.failures
+
+    if (baseline.width, baseline.height) != (candidate.width, candidate.height):
+        failures.append(
+            f"size {candidate.width}x{candidate.height} != {baseline.width}x{baseline.height}"
+        )
+        return result
+
+    # Whole frames of allowance plus half a frame for timestamp rounding.
+    frame_seconds = (frame_tolerance + 0.5) / frame_rate
+    if abs(candidate.video_seconds - baseline.video_seconds) > frame_seconds:
+        failures.append(
+            f"video duration {candidate.video_seconds:.3f}s != {baseline.video_seconds:.3f}s"
+        )
+
+    if (baseline.audio_start is None) != (candidate.audio_start is None):
+        failures.append("audio stream presence differs")
+    elif candidate.audio_start is not None:
+        # Sync is where audio starts relative to video; durations are separate.
+        offset = candidate.audio_start - candidate.video_start
+        baseline_offset = baseline.audio_start - baseline.video_start
+        if abs(offset - baseline_offset) > thresholds.sync_tolerance_seconds:
+            failures.append(
+                f"A/V offset {offset * 1000:+.1f}ms vs baseline {baseline_offset * 1000:+.1f}ms"
+            )
+        audio_delta = abs(candidate.audio_seconds - baseline.audio_seconds)
+        if audio_delta > thresholds.audio_tolerance_seconds:
+            failures.append(
+                f"audio duration {candidate.audio_seconds:.3f}s != {baseline.audio_seconds:.3f}s"
+            )
+
+    size = (baseline.width, baseline.height)
+    decoded = zip_longest(decode_frames(baseline_path, *size), decode_frames(candidate_path, *size))
+    for reference, frame in decoded:
+        result.baseline_frames += reference is not None
+        result.candidate_frames += frame is not None
+        if reference is not None and frame is not None:
+            result.psnr_values.append(psnr(reference, frame))
+            result.ssim_values.append(ssim(reference, frame))
+
+    frame_delta = abs(result.candidate_frames - result.baseline_frames)
+    if frame_delta > frame_tolerance:
+        failures.append(
+            f"frame count {result.candidate_frames} != {result.baseline_frames}"
+        )
+
+    worst = [
+        index
+        for index, (p, s) in enumerate(zip(result.psnr_values, result.ssim_values))
+        if p < thresholds.min_psnr or s < thresholds.min_ssim
+    ]
+    if worst:
+        index = worst[0]
+        failures.append(
+            f"{len(worst)} frame(s) below thresholds, first #{index}: "
+            f"psnr={result.psnr_values[index]:.2f}dB ssim={result.ssim_values[index]:.4f}"
+        )
+    return result
+
+
+def run_harness(
+    work_dir: Path,
+    baseline: str = "render",
+    candidates: Sequence[str] = ("checkpointed", "streaming"),
+    fixtures: Optional[Sequence[Fixture]] = None,
+    thresholds: Thresholds = Thresholds(),
+) -> List[Comparison]:
+    """Render every fixture through ``baseline`` and each candidate and compare."""
+
+    results = []
+    for fixture in fixtures or FIXTURES:
+        root = work_dir / fixture.name
+        config = materialize_fixture(fixture, root / "inputs", root / f"{baseline}.mp4")
+        baseline_path = ENGINES[baseline].render(config)
+        for name in candidates:
+            candidate_config = dataclasses.replace(config, output_video=root / f"{name}.mp4")
+            candidate_path = ENGINES[name].render(candidate_config)
+            comparison = compare_outputs(
+                fixture.name,
+                name,
+                baseline_path,
+                candidate_path,
+                config.frame_rate,
+                thresholds,
+                ENGINES[name].frame_tolerance,
+            )
+            logger.debug(comparison.summary())
+            results.append(comparison)
+    return results
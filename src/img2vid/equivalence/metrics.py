@@ -0,0 +1,129 @@
+"""Frame similarity metrics and ffmpeg-based decoding for rendered outputs."""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import dataclasses
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114])
+
+
+def psnr(reference: np.ndarray, candidate: np.ndarray) -> float:
+    """Peak signal-to-noise ratio in dB; ``inf`` for identical frames."""
+
+    error = np.mean((reference.astype(np.float64) - candidate.astype(np.float64)) ** 2)
+    if error == 0:
+        return float("inf")
+    return float(10 * np.log10(255.0**2 / error))
+
+
+def _box_mean(values: np.ndarray) -> np.ndarray:
+    # Mean over every SSIM_WINDOW x SSIM_WINDOW window via an integral image.
+    integral = np.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    w = SSIM_WINDOW
+    sums = integral[w:, w:] - integral[:-w, w:] - integral[w:, :-w] + integral[:-w, :-w]
+    return sums / (w * w)
+
+
+def ssim(reference: np.ndarray, candidate: np.ndarray) -> float:
+    """Mean structural similarity of the luma planes with a uniform window."""
+
+    x = reference.astype(np.float64) @ LUMA_WEIGHTS
+    y = candidate.astype(np.float64) @ LUMA_WEIGHTS
+    if min(x.shape) < SSIM_WINDOW:
+        return 1.0 if np.array_equal(x, y) else 0.0
+
+    mu_x, mu_y = _box_mean(x), _box_mean(y)
+    var_x = _box_mean(x * x) - mu_x**2
+    var_y = _box_mean(y * y) - mu_y**2
+    covariance = _box_mean(x * y) - mu_x * mu_y
+    numerator = (2 * mu_x * mu_y + SSIM_C1) * (2 * covariance + SSIM_C2)
+    denominator = (mu_x**2 + mu_y**2 + SSIM_C1) * (var_x + var_y + SSIM_C2)
+    return float(np.mean(numerator / denominator))
+
+
+@dataclass(frozen=True, slots=True)
+class StreamInfo:
+    """Frame size and per-stream presentation spans measured from an encoded file."""
+
+    width: int
+    height: int
+    video_start: float
+    video_seconds: float
+    audio_start: Optional[float] = None
+    audio_seconds: Optional[float] = None
+
+
+def _packet_spans(path: Path) -> Dict[int, Tuple[float, float]]:
+    # Stream-copying to framecrc lists every packet's pts and duration, so the
+    # presentation start and end of each stream come out of a single pass.
+    from moviepy.config import FFMPEG_BINARY
+
+    result = subprocess.run(
+        [
+            FFMPEG_BINARY, "-nostdin", "-loglevel", "error", "-i", str(path),
+            "-map", "0:v:0", "-map", "0:a:0?", "-c", "copy", "-f", "framecrc", "-",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Could not read packets of {path}: {result.stderr.strip()}")
+
+    time_bases: Dict[int, float] = {}
+    spans: Dict[int, Tuple[float, float]] = {}
+    for line in result.stdout.splitlines():
+        if match := re.match(r"#tb (\d+): (\d+)/(\d+)", line):
+            time_bases[int(match[1])] = int(match[2]) / int(match[3])
+            continue
+        if line.startswith("#"):
+            continue
+        index, _dts, pts, duration = (int(field) for field in line.split(",")[:4])
+        base = time_bases[index]
+        start, end = pts * base, (pts + duration) * base
+        if index in spans:
+            start, end = min(start, spans[index][0]), max(end, spans[index][1])
+        spans[index] = (start, end)
+    return spans
+
+
+def probe_streams(path: Path) -> StreamInfo:
+    """Measure the frame size and the video and audio stream spans of ``path``."""
+
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    width, height = ffmpeg_parse_infos(str(path))["video_size"]
+    spans = _packet_spans(path)
+    video_start, video_end = spans.get(0, (0.0, 0.0))
+    info = StreamInfo(width, height, video_start, video_end - video_start)
+    if 1 in spans:
+        audio_start, audio_end = spans[1]
+        info = dataclasses.replace(
+            info, audio_start=audio_start, audio_seconds=audio_end - audio_start
+        )
+    return info
+
+
+def decode_frames(path: Path, width: int, height: int) -> Iterator[np.ndarray]:
+    """Yield every decoded RGB frame of ``path`` without resampling the timeline."""
+
+    from moviepy.config import FFMPEG_BINARY
+
+    frame_bytes = width * height * 3
+    command = [
+        FFMPEG_BINARY, "-nostdin", "-loglevel", "error", "-i", str(path),
+        "-map", "0:v:0", "-vsync", "passthrough", "-f", "rawvideo", "-pix_fmt", "rgb24", "-",
+    ]
+    with subprocess.Popen(command, stdout=subprocess.PIPE) as process:
+        assert process.stdout is not None
+        while len(chunk := process.stdout.read(frame_bytes)) == frame_bytes:
+            yield np.frombuffer(chunk, dtype=np.uint8).reshape(height, width, 3)
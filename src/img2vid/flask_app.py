@@ -3,96 +3,187 @@
 from __future__ import annotations
 
 import logging
+import tempfile
+import threading
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
-from flask import Flask, jsonify, request
+from flask import Flask, abort, jsonify, request, send_from_directory, url_for
+from werkzeug.exceptions import HTTPException
 
+from . import converter
 from .converter import (
-    DEFAULT_TEXT_DURATION_MS,
+    PLAYLIST_NAME,
+    AdmissionController,
+    AdmissionRejected,
     ConversionConfig,
     ConversionError,
-    resolve_output_path,
-    render_video,
+    estimate_job_cost,
+    list_image_files,
+    release_output_path,
 )
+from .payloads import build_config
+from .stream_jobs import StreamJobStore
+from .uploads import DEFAULT_MAX_UPLOAD_BYTES, DEFAULT_MAX_UPLOAD_MEMBERS, UploadSpool
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SERVICE_SETTINGS: Dict[str, Any] = {
+    "RENDER_MEMORY_BUDGET_MB": 4096,
+    "RENDER_CPU_BUDGET_UNITS": 250.0,
+    "RENDER_MAX_QUEUE": 16,
+    "RENDER_MAX_WAIT_SECONDS": 30.0,
+    "RENDER_RETRY_AFTER_SECONDS": 30,
+    "RENDER_LEDGER_DIR": str(Path(tempfile.gettempdir()) / "img2vid-admission"),
+    "UPLOAD_SPOOL_ROOT": str(Path(tempfile.gettempdir()) / "img2vid-uploads"),
+    "UPLOAD_CHUNK_BYTES": 1024 * 1024,
+    "UPLOAD_MAX_BYTES": DEFAULT_MAX_UPLOAD_BYTES,
+    "UPLOAD_MAX_FILES": DEFAULT_MAX_UPLOAD_MEMBERS,
+    "STREAM_ROOT": str(Path(tempfile.gettempdir()) / "img2vid-streams"),
+    "STREAM_TTL_SECONDS": 3600.0,
+}
 
-def create_app() -> Flask:
-    app = Flask(__name__)
 
-    @app.post("/render")
-    def render_endpoint():
-        payload: Dict[str, Any] = request.get_json(force=True, silent=True) or {}
+def _error(message: str, status: int):
+    return jsonify({"status": "error", "message": message}), status
+
+
+def _run_stream_job(
+    store: StreamJobStore, job_id: str, config: ConversionConfig, resources: ExitStack
+) -> None:
+    with resources:
         try:
-            input_dir = Path(payload["input_dir"])
-            explicit_output = (
-                Path(payload["output_video"])
-                if payload.get("output_video")
-                else None
-            )
-            output_video = resolve_output_path(
-                input_dir=input_dir,
-                explicit_output=explicit_output,
-                output_root=Path(payload["output_dir"])
-                if payload.get("output_dir")
-                else None,
-                output_basename=payload.get("output_name"),
-            )
+            output_video = converter.render_video(config)
+        except Exception as exc:
+            logger.exception("Streaming render %s failed", job_id)
+            store.update(job_id, status="error", message=str(exc))
+        else:
+            store.update(job_id, status="success", output_video=str(output_video))
 
-            config = ConversionConfig(
-                input_dir=input_dir,
-                output_video=output_video,
-                audio_path=Path(payload["audio"]) if payload.get("audio") else None,
-                frame_duration_ms=int(payload.get("frame_duration_ms", 3000)),
-                transition_ms=int(payload.get("transition_ms", 500)),
-                frame_rate=int(payload.get("frame_rate", 30)),
-                start_text=payload.get("start_text"),
-                end_text=payload.get("end_text"),
-                text_duration_ms=int(
-                    payload.get("text_duration_ms", DEFAULT_TEXT_DURATION_MS)
-                ),
-                text_font=payload.get("text_font"),
-                text_font_size=int(payload.get("text_font_size", 54)),
-                text_color=payload.get("text_color", "white"),
-                text_bg_color=payload.get("text_bg_color", "#000000"),
+
+def _admission_from_config(app: Flask) -> AdmissionController:
+    settings = app.config
+    return AdmissionController(
+        ledger_dir=Path(settings["RENDER_LEDGER_DIR"]),
+        memory_budget_bytes=int(settings["RENDER_MEMORY_BUDGET_MB"]) * 1024 * 1024,
+        cpu_budget_units=float(settings["RENDER_CPU_BUDGET_UNITS"]),
+        max_queue=int(settings["RENDER_MAX_QUEUE"]),
+        max_wait_seconds=float(settings["RENDER_MAX_WAIT_SECONDS"]),
+        retry_after_seconds=int(settings["RENDER_RETRY_AFTER_SECONDS"]),
+    )
+
+
+def create_app(admission: Optional[AdmissionController] = None) -> Flask:
+    app = Flask(__name__)
+    app.config.from_mapping(DEFAULT_SERVICE_SETTINGS)
+    app.config.from_prefixed_env("IMG2VID")
+    admission = admission or _admission_from_config(app)
+    streams = StreamJobStore(
+        Path(app.config["STREAM_ROOT"]), float(app.config["STREAM_TTL_SECONDS"])
+    )
+
+    def _submit(payload: Mapping[str, Any], resources: ExitStack):
+        """Admit and run a render; ``resources`` are closed once it finishes."""
+
+        config: Optional[ConversionConfig] = None
+        handed_off = False
+        try:
+            config = build_config(payload)
+            config.validate()
+            cost = estimate_job_cost(config, list_image_files(config.input_dir))
+            logger.info(
+                "Render cost estimate: %.0f MiB, %.1f CPU units",
+                cost.memory_bytes / (1024 * 1024),
+                cost.cpu_units,
             )
-            output_path = render_video(config)
+            resources.enter_context(admission.reserve(cost))
+            if config.stream_output:
+                job_id, config.stream_dir = streams.create()
+                handed_off = True
+                return _start_stream_job(job_id, config, resources.pop_all())
+            output_path = converter.render_video(config)
         except KeyError as exc:
             missing_key = str(exc).strip("'")
             logger.warning("Missing required field in request: %s", missing_key)
-            return (
-                jsonify(
-                    {
-                        "status": "error",
-                        "message": f"Missing required field: {missing_key}",
-                    }
-                ),
-                400,
-            )
+            return _error(f"Missing required field: {missing_key}", 400)
+        except AdmissionRejected as exc:
+            logger.warning("Render rejected: %s", exc)
+            response, status = _error(str(exc), 429)
+            response.headers["Retry-After"] = str(exc.retry_after_seconds)
+            return response, status
         except ConversionError as exc:
             logger.warning("Conversion error: %s", exc)
-            return (
-                jsonify({"status": "error", "message": str(exc)}),
-                400,
-            )
+            return _error(str(exc), 400)
         except Exception as exc:  # pragma: no cover - safety net
             logger.exception("Unexpected failure during rendering")
-            return (
-                jsonify({"status": "error", "message": str(exc)}),
-                500,
+            return _error(str(exc), 500)
+        finally:
+            resources.close()
+            # Renders release their own reservation; requests rejected before
+            # rendering must free the v### folder they were allotted.
+            if config is not None and not handed_off:
+                release_output_path(config.output_video)
+
+        return jsonify({"status": "success", "output_video": str(output_path)}), 200
+
+    def _start_stream_job(job_id: str, config: ConversionConfig, resources: ExitStack):
+        threading.Thread(
+            target=_run_stream_job,
+            args=(streams, job_id, config, resources),
+            name=f"img2vid-stream-{job_id}",
+            daemon=True,
+        ).start()
+        playlist = url_for("stream_file", job_id=job_id, filename=PLAYLIST_NAME)
+        status = {"status": "accepted", "job_id": job_id, "playlist": playlist}
+        status["job"] = url_for("job_status", job_id=job_id)
+        return jsonify(status), 202
+
+    @app.post("/render")
+    def render_endpoint():
+        payload: Dict[str, Any] = request.get_json(force=True, silent=True) or {}
+        return _submit(payload, ExitStack())
+
+    @app.post("/render/upload")
+    def upload_endpoint():
+        resources = ExitStack()
+        try:
+            spool = UploadSpool(
+                Path(app.config["UPLOAD_SPOOL_ROOT"]),
+                name=request.args.get("name", "upload"),
+                chunk_size=int(app.config["UPLOAD_CHUNK_BYTES"]),
+                max_bytes=int(app.config["UPLOAD_MAX_BYTES"]),
+                max_members=int(app.config["UPLOAD_MAX_FILES"]),
             )
+            resources.callback(spool.cleanup)
+            boundary = request.mimetype_params.get("boundary")
+            spool.ingest(request.stream, request.mimetype, boundary)
+        except HTTPException:
+            resources.close()
+            raise
+        except ConversionError as exc:
+            resources.close()
+            logger.warning("Rejected upload: %s", exc)
+            return _error(str(exc), 400)
+        except Exception as exc:  # pragma: no cover - safety net
+            resources.close()
+            logger.exception("Unexpected failure while receiving upload")
+            return _error(str(exc), 500)
+
+        payload: Dict[str, Any] = {**request.args.to_dict(), **spool.fields}
+        payload["input_dir"] = str(spool.images_dir)
+        payload["audio"] = str(spool.audio_path) if spool.audio_path else None
+        return _submit(payload, resources)
+
+    @app.get("/render/<job_id>")
+    def job_status(job_id: str):
+        return jsonify(streams.get(job_id) or abort(404))
 
-        return (
-            jsonify(
-                {
-                    "status": "success",
-                    "output_video": str(output_path),
-                }
-            ),
-            200,
-        )
+    @app.get("/streams/<job_id>/<path:filename>")
+    def stream_file(job_id: str, filename: str):
+        directory = streams.directory(job_id) or abort(404)
+        # The playlist is rewritten as segments land, so never let it be cached.
+        return send_from_directory(directory, filename, max_age=0)
 
     return app
 
@@ -1,28 +1,83 @@
-"""Helper utilities for the img2vid conversion pipeline."""
+"""Helper utilities for the img2vid conversion pipeline.
 
+Modules that pull in MoviePy (and through it NumPy and ffmpeg discovery)
+are imported on first attribute access so that validation-only callers
+such as ``img2vid --check`` stay fast.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .admission import (
+    AdmissionController,
+    AdmissionRejected,
+    JobCost,
+    estimate_job_cost,
+)
 from .config import (
     DEFAULT_FRAME_RATE,
+    DEFAULT_SEGMENT_SECONDS,
     DEFAULT_TEXT_DURATION_MS,
+    FIT_MODES,
     SUPPORTED_IMAGE_EXTENSIONS,
+    TRANSITIONS,
     ConversionConfig,
     ConversionError,
 )
-from .images import build_video_clip, list_image_files
-from .audio import attach_audio
-from .output_paths import resolve_output_path
-from .tempfiles import temporary_directory
-from .render import render_video
+from .images import (
+    build_video_clip,
+    list_image_files,
+    read_image_sizes,
+    resolve_canvas_size,
+)
+from .output_paths import release_output_path, resolve_output_path
+from .streaming import PLAYLIST_NAME, stream_directory
+
+if TYPE_CHECKING:
+    from .audio import attach_audio
+    from .normalize import normalize_images
+    from .render import render_video
+    from .tempfiles import temporary_directory
+
+_LAZY_ATTRIBUTES = {
+    "attach_audio": ".audio",
+    "normalize_images": ".normalize",
+    "render_video": ".render",
+    "temporary_directory": ".tempfiles",
+}
 
 __all__ = [
     "DEFAULT_FRAME_RATE",
+    "DEFAULT_SEGMENT_SECONDS",
     "DEFAULT_TEXT_DURATION_MS",
+    "FIT_MODES",
+    "PLAYLIST_NAME",
     "SUPPORTED_IMAGE_EXTENSIONS",
+    "TRANSITIONS",
+    "AdmissionController",
+    "AdmissionRejected",
     "ConversionConfig",
     "ConversionError",
+    "JobCost",
     "attach_audio",
     "build_video_clip",
+    "estimate_job_cost",
     "list_image_files",
+    "normalize_images",
+    "read_image_sizes",
+    "release_output_path",
     "render_video",
+    "resolve_canvas_size",
     "resolve_output_path",
+    "stream_directory",
     "temporary_directory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
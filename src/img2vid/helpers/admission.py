@@ -0,0 +1,192 @@
+"""Cost estimation and host-wide admission control for render jobs."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+from .admission_ledger import AdmissionLedger
+from .config import ConversionConfig, ConversionError
+from .images import read_image_sizes, resolve_canvas_size
+
+# Every image is normalized to a canvas-sized uint8 RGB array up front; the
+# compositor keeps a few extra canvas buffers alive (composite, mask, encoder
+# input) per render.
+BYTES_PER_PIXEL = 3
+CANVAS_BUFFERS = 4
+BASE_JOB_MEMORY_BYTES = 64 * 1024 * 1024
+LEDGER_POLL_SECONDS = 0.25
+
+
+class AdmissionRejected(ConversionError):
+    """Raised when a job cannot be admitted within the host budget."""
+
+    def __init__(self, message: str, retry_after_seconds: int) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class JobCost:
+    """Estimated resource footprint of a single render.
+
+    ``cpu_units`` is a rate: canvas megapixels composited and encoded per
+    second of output, which is what a running render loads the host with
+    regardless of how long its timeline is.
+    """
+
+    memory_bytes: int
+    cpu_units: float
+    duration_seconds: float
+
+
+def estimate_job_cost(config: ConversionConfig, image_files: Sequence[Path]) -> JobCost:
+    """Estimate memory and CPU cost from image count, resolution and duration.
+
+    Only image headers are read. Memory covers every normalized frame (kept
+    resident for the whole render) plus canvas buffers; CPU units are canvas
+    megapixels times the frame rate.
+    """
+
+    sizes = read_image_sizes(image_files)
+    canvas_width, canvas_height = resolve_canvas_size(
+        sizes, config.canvas_width, config.canvas_height
+    )
+    canvas_pixels = canvas_width * canvas_height
+
+    frame_seconds = config.frame_duration_ms / 1000.0
+    transition_seconds = config.transition_ms / 1000.0
+    duration = len(sizes) * frame_seconds - max(len(sizes) - 1, 0) * transition_seconds
+    text_seconds = config.text_duration_ms / 1000.0
+    for text in (config.start_text, config.end_text):
+        if text and text.strip():
+            duration += text_seconds
+
+    memory = (
+        BASE_JOB_MEMORY_BYTES
+        + len(sizes) * canvas_pixels * BYTES_PER_PIXEL
+        + canvas_pixels * BYTES_PER_PIXEL * CANVAS_BUFFERS
+    )
+    cpu_units = canvas_pixels * config.frame_rate / 1_000_000
+    return JobCost(memory_bytes=memory, cpu_units=cpu_units, duration_seconds=duration)
+
+
+class AdmissionController:
+    """Admit jobs against a host-wide memory and CPU budget.
+
+    Running and waiting jobs of every service process are recorded in an
+    :class:`AdmissionLedger` under ``ledger_dir``, so workers sharing that
+    directory share one budget. Waiting jobs are ordered by estimated memory
+    so small renders run ahead of large ones. A job that fits is admitted
+    straight away; otherwise it waits, and is rejected with
+    :class:`AdmissionRejected` if ``max_queue`` jobs are already waiting or
+    it cannot start within ``max_wait_seconds``. A job larger than the whole
+    budget is clamped to it, so it runs alone instead of being refused
+    forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        ledger_dir: Path,
+        memory_budget_bytes: int,
+        cpu_budget_units: float,
+        max_queue: int = 16,
+        max_wait_seconds: float = 30.0,
+        retry_after_seconds: int = 30,
+    ) -> None:
+        self.ledger = AdmissionLedger(ledger_dir)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.cpu_budget_units = cpu_budget_units
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.retry_after_seconds = retry_after_seconds
+        # Wakes waiters in this process at once; other processes' releases
+        # are picked up by polling the ledger.
+        self._released = threading.Condition()
+
+    def _clamp(self, cost: JobCost) -> Tuple[int, float]:
+        return (
+            min(cost.memory_bytes, self.memory_budget_bytes),
+            min(cost.cpu_units, self.cpu_budget_units),
+        )
+
+    def _try_admit(self, entries: Dict[str, Dict[str, Any]], key: str) -> bool:
+        """Mark ``key`` running if it is the smallest waiting job that fits."""
+
+        running = [entry for entry in entries.values() if entry["running"]]
+        memory_in_use = sum(entry["memory"] for entry in running)
+        cpu_in_use = sum(entry["cpu"] for entry in running)
+        waiting = sorted(
+            (entry["memory"], entry["queued_at"], name)
+            for name, entry in entries.items()
+            if not entry["running"]
+        )
+        for _, _, name in waiting:
+            entry = entries[name]
+            if (
+                memory_in_use + entry["memory"] <= self.memory_budget_bytes
+                and cpu_in_use + entry["cpu"] <= self.cpu_budget_units
+            ):
+                if name != key:
+                    return False
+                entry["running"] = True
+                return True
+        return False
+
+    def _release(self, key: str) -> None:
+        with self.ledger.transaction() as entries:
+            entries.pop(key, None)
+        with self._released:
+            self._released.notify_all()
+
+    @contextmanager
+    def reserve(self, cost: JobCost) -> Iterator[None]:
+        """Block until ``cost`` fits the budget, hold it, then release it."""
+
+        memory, cpu = self._clamp(cost)
+        key = f"{os.getpid()}-{uuid.uuid4().hex}"
+        entry = {
+            "pid": os.getpid(),
+            "memory": memory,
+            "cpu": cpu,
+            "queued_at": time.time(),
+            "running": False,
+        }
+        with self.ledger.transaction() as entries:
+            queued = sum(not other["running"] for other in entries.values())
+            entries[key] = entry
+            admitted = self._try_admit(entries, key)
+            queue_full = not admitted and queued >= self.max_queue
+            if queue_full:
+                del entries[key]
+        if queue_full:
+            raise AdmissionRejected("Render queue is full", self.retry_after_seconds)
+
+        deadline = time.monotonic() + self.max_wait_seconds
+        try:
+            while not admitted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise AdmissionRejected(
+                        "Render host is over budget", self.retry_after_seconds
+                    )
+                with self._released:
+                    self._released.wait(min(remaining, LEDGER_POLL_SECONDS))
+                with self.ledger.transaction() as entries:
+                    entries.setdefault(key, entry)
+                    admitted = self._try_admit(entries, key)
+        except BaseException:
+            self._release(key)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(key)
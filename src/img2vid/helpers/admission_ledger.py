@@ -0,0 +1,82 @@
+"""Host-wide record of admitted and waiting renders, shared through a locked file."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from .config import ConversionError
+from .output_paths import _pid_alive
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FILE_NAME = "ledger.json"
+LOCK_FILE_NAME = "ledger.lock"
+
+Entries = Dict[str, Dict[str, Any]]
+
+
+class AdmissionLedger:
+    """Reservations of every service process on this host.
+
+    Entries live in ``<directory>/ledger.json`` and are only read or written
+    while holding an ``flock`` on ``ledger.lock``, so all workers pointed at
+    the same directory see one budget. Each entry records the PID that made
+    it; entries of processes that have died are dropped on the next
+    transaction, so a killed worker cannot leak its share of the budget.
+    The directory must be local to the host, since PIDs are host-local.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        if fcntl is None:
+            raise ConversionError(
+                "Host-wide admission control needs fcntl.flock, which this "
+                "platform does not provide"
+            )
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / LEDGER_FILE_NAME
+        self.lock_path = directory / LOCK_FILE_NAME
+        self._guard = threading.Lock()
+
+    def _load(self) -> Entries:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning("Discarding unreadable admission ledger %s", self.path)
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _store(self, entries: Entries) -> None:
+        staging = self.path.with_name(f".{LEDGER_FILE_NAME}.{os.getpid()}.tmp")
+        staging.write_text(json.dumps(entries), encoding="utf-8")
+        staging.replace(self.path)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Entries]:
+        """Yield the live entries under the host lock and write back any changes."""
+
+        with self._guard:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                entries = {
+                    key: entry
+                    for key, entry in self._load().items()
+                    if int(entry.get("pid", 0)) > 0 and _pid_alive(int(entry["pid"]))
+                }
+                yield entries
+                self._store(entries)
+            finally:
+                os.close(fd)
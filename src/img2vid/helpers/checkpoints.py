@@ -0,0 +1,180 @@
+"""Segment-level checkpointing so interrupted renders can resume."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import shutil
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from moviepy.config import FFMPEG_BINARY
+from moviepy.tools import subprocess_call
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from .config import ConversionConfig, ConversionError
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+AUDIO_NAME = "audio.m4a"
+CHUNK_PATTERN = "chunk_{index:05d}.mp4"
+
+
+def checkpoint_directory(output_path: Path) -> Path:
+    """Return the hidden folder holding encoded chunks for ``output_path``."""
+
+    return output_path.parent / f".{output_path.stem}.checkpoint"
+
+
+def config_fingerprint(config: ConversionConfig, image_files: Sequence[Path]) -> str:
+    """Hash the settings and source files that determine the encoded output."""
+
+    settings = {key: str(value) for key, value in asdict(config).items()}
+    settings.pop("output_video", None)
+    sources = []
+    for path in [*image_files, config.audio_path]:
+        if path is not None:
+            stat = path.stat()
+            sources.append([path.name, stat.st_size, stat.st_mtime_ns])
+    payload = json.dumps([settings, sources], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_manifest(checkpoint_dir: Path, fingerprint: str) -> Dict[str, Any]:
+    manifest_path = checkpoint_dir / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    if manifest.get("fingerprint") == fingerprint:
+        return manifest
+
+    if checkpoint_dir.exists():
+        logger.info("Discarding stale checkpoint in %s", checkpoint_dir)
+        shutil.rmtree(checkpoint_dir)
+    checkpoint_dir.mkdir(parents=True)
+    return {"fingerprint": fingerprint, "chunks": [], "audio": False}
+
+
+def _save_manifest(checkpoint_dir: Path, manifest: Dict[str, Any]) -> None:
+    staging = checkpoint_dir / f"{MANIFEST_NAME}.tmp"
+    staging.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    staging.replace(checkpoint_dir / MANIFEST_NAME)
+
+
+def write_checkpointed_video(
+    video_clip,
+    output_path: Path,
+    *,
+    fingerprint: str,
+    frame_rate: int,
+    checkpoint_seconds: float,
+    audio_codec: Optional[str],
+) -> None:
+    """Encode ``video_clip`` chunk by chunk, resuming any completed chunks.
+
+    Each chunk covers a whole-frame range, is checked for its exact frame
+    count and is renamed into place only once finished, so the manifest
+    never lists a partial file. The soundtrack is encoded once and muxed
+    during the final stream-copy concat.
+    """
+
+    checkpoint_dir = checkpoint_directory(output_path)
+    manifest = _load_manifest(checkpoint_dir, fingerprint)
+    completed = set(manifest["chunks"])
+
+    # Chunk edges are whole frame indices, so float rounding at a boundary
+    # can never drop or duplicate a frame. The total uses the same
+    # ``int(duration * fps)`` rule as ``Clip.iter_frames``, so the joined
+    # output has exactly the frames an uninterrupted render would write.
+    frames_per_chunk = max(1, round(checkpoint_seconds * frame_rate))
+    total_frames = max(1, int((video_clip.duration or 0.0) * frame_rate))
+    chunk_count = math.ceil(total_frames / frames_per_chunk)
+    frame_counts = manifest.setdefault("frame_counts", {})
+    if completed:
+        logger.info("Resuming render: %d/%d chunk(s) done", len(completed), chunk_count)
+
+    chunk_names = []
+    for index in range(chunk_count):
+        chunk_name = CHUNK_PATTERN.format(index=index)
+        chunk_names.append(chunk_name)
+        start_frame = index * frames_per_chunk
+        count = min(frames_per_chunk, total_frames - start_frame)
+        if (
+            chunk_name in completed
+            and frame_counts.get(chunk_name) == count
+            and (checkpoint_dir / chunk_name).is_file()
+        ):
+            continue
+
+        logger.info(
+            "Encoding chunk %d/%d (frames %d-%d)",
+            index + 1,
+            chunk_count,
+            start_frame,
+            start_frame + count - 1,
+        )
+        staging = checkpoint_dir / f"partial_{chunk_name}"
+        # MoviePy writes int(duration * fps) frames; the extra half frame keeps
+        # that exactly ``count`` whatever the binary rounding of the edges.
+        chunk_clip = video_clip.subclipped(start_frame / frame_rate).with_duration(
+            (count + 0.5) / frame_rate
+        )
+        chunk_clip.write_videofile(
+            str(staging),
+            codec="libx264",
+            audio=False,
+            fps=frame_rate,
+            preset="medium",
+            logger=None,
+        )
+        encoded = ffmpeg_parse_infos(str(staging)).get("video_n_frames")
+        if encoded != count:
+            raise ConversionError(
+                f"Chunk {chunk_name} has {encoded} frame(s), expected {count}"
+            )
+        staging.replace(checkpoint_dir / chunk_name)
+        if chunk_name not in manifest["chunks"]:
+            manifest["chunks"].append(chunk_name)
+        frame_counts[chunk_name] = count
+        _save_manifest(checkpoint_dir, manifest)
+
+    encoded_total = sum(frame_counts.get(name, 0) for name in chunk_names)
+    if encoded_total != total_frames:
+        raise ConversionError(
+            f"Checkpoint chunks hold {encoded_total} frame(s), expected {total_frames}"
+        )
+
+    audio_args = []
+    if audio_codec and video_clip.audio is not None:
+        if not manifest["audio"]:
+            staging = checkpoint_dir / f"partial_{AUDIO_NAME}"
+            video_clip.audio.write_audiofile(str(staging), codec=audio_codec, logger=None)
+            staging.replace(checkpoint_dir / AUDIO_NAME)
+            manifest["audio"] = True
+            _save_manifest(checkpoint_dir, manifest)
+        audio_args = ["-i", str(checkpoint_dir / AUDIO_NAME), "-map", "0:v", "-map", "1:a"]
+
+    concat_list = checkpoint_dir / "chunks.txt"
+    concat_list.write_text(
+        "".join(f"file '{name}'\n" for name in chunk_names), encoding="utf-8"
+    )
+    logger.info("Concatenating %d chunk(s) into %s", chunk_count, output_path)
+    try:
+        subprocess_call(
+            [
+                FFMPEG_BINARY, "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", str(concat_list),
+                *audio_args,
+                "-c", "copy", "-movflags", "+faststart",
+                str(output_path),
+            ],
+            logger=None,
+        )
+    except OSError as exc:
+        raise ConversionError(f"Failed to concatenate checkpoint chunks: {exc}") from exc
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 SUPPORTED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
 DEFAULT_FRAME_RATE = 30
 DEFAULT_TEXT_DURATION_MS = 2000
+DEFAULT_SEGMENT_SECONDS = 2.0
+FIT_MODES = ("letterbox", "cover", "pad")
+TRANSITIONS = ("crossfade", "dissolve", "wipe", "slide", "zoom")
 
 
 class ConversionError(Exception):
@@ -24,6 +27,8 @@ class ConversionConfig:
     audio_path: Optional[Path] = None
     frame_duration_ms: int = 3000
     transition_ms: int = 500
+    transition: str = "crossfade"
+    transition_sequence: Optional[Tuple[str, ...]] = None
     frame_rate: int = DEFAULT_FRAME_RATE
     start_text: Optional[str] = None
     end_text: Optional[str] = None
@@ -32,6 +37,14 @@ class ConversionConfig:
     text_font_size: int = 54
     text_color: str = "white"
     text_bg_color: str = "#000000"
+    stream_output: bool = False
+    stream_dir: Optional[Path] = None
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS
+    checkpoint_seconds: Optional[float] = None
+    canvas_width: Optional[int] = None
+    canvas_height: Optional[int] = None
+    fit_mode: str = "pad"
+    background_color: str = "#000000"
 
     def validate(self) -> None:
         if not self.input_dir.is_dir():
@@ -51,6 +64,12 @@ class ConversionConfig:
                 "Transition duration cannot exceed frame duration"
             )
 
+        for name in (self.transition, *(self.transition_sequence or ())):
+            if name not in TRANSITIONS:
+                raise ConversionError(
+                    f"Unknown transition: {name}. Choose from {list(TRANSITIONS)}"
+                )
+
         if self.frame_rate <= 0:
             raise ConversionError("Frame rate must be a positive integer")
 
@@ -61,3 +80,35 @@ class ConversionConfig:
 
         if self.text_font_size <= 0:
             raise ConversionError("Text font size must be greater than 0")
+
+        if (self.canvas_width is None) != (self.canvas_height is None):
+            raise ConversionError("Canvas width and height must be set together")
+
+        if self.canvas_width is not None and (
+            self.canvas_width <= 0 or self.canvas_height <= 0
+        ):
+            raise ConversionError("Canvas dimensions must be greater than 0")
+
+        if self.fit_mode not in FIT_MODES:
+            raise ConversionError(
+                f"Unknown fit mode: {self.fit_mode}. Choose from {list(FIT_MODES)}"
+            )
+
+        # Pillow is imported here so the CLI and service stay light to import.
+        from PIL import ImageColor
+
+        try:
+            ImageColor.getrgb(self.background_color)
+        except ValueError as exc:
+            raise ConversionError(
+                f"Invalid background color: {self.background_color}"
+            ) from exc
+
+        if self.stream_output and self.segment_seconds <= 0:
+            raise ConversionError("Segment duration must be greater than 0 seconds")
+
+        if self.checkpoint_seconds is not None:
+            if self.checkpoint_seconds <= 0:
+                raise ConversionError("Checkpoint interval must be greater than 0 seconds")
+            if self.stream_output:
+                raise ConversionError("Checkpointing cannot be combined with streaming output")
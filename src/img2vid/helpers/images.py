@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Sequence
-
-from moviepy import ImageClip, concatenate_videoclips
-from moviepy.video.fx import CrossFadeIn
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 from .config import DEFAULT_FRAME_RATE, ConversionError, SUPPORTED_IMAGE_EXTENSIONS
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,30 +31,79 @@ def list_image_files(input_dir: Path) -> List[Path]:
     return image_files
 
 
+def read_image_sizes(image_files: Sequence[Path]) -> List[Tuple[int, int]]:
+    """Return ``(width, height)`` for each image, reading headers only."""
+
+    from PIL import Image
+
+    sizes = []
+    for image_path in image_files:
+        try:
+            with Image.open(image_path) as image:
+                sizes.append(image.size)
+        except OSError as exc:
+            raise ConversionError(f"Unreadable image {image_path.name}: {exc}") from exc
+    return sizes
+
+
+def resolve_canvas_size(
+    sizes: Sequence[Tuple[int, int]],
+    canvas_width: Optional[int] = None,
+    canvas_height: Optional[int] = None,
+) -> Tuple[int, int]:
+    """Return the output canvas, defaulting to the largest input dimensions.
+
+    Dimensions are rounded up to even values as required by H.264 4:2:0.
+    """
+
+    if canvas_width is None or canvas_height is None:
+        canvas_width = max(width for width, _ in sizes)
+        canvas_height = max(height for _, height in sizes)
+    return canvas_width + canvas_width % 2, canvas_height + canvas_height % 2
+
+
 def build_video_clip(
-    image_files: Sequence[Path],
+    frames: Sequence[np.ndarray],
     frame_duration_ms: int,
     transition_ms: int,
     frame_rate: int = DEFAULT_FRAME_RATE,
+    transition: str = "crossfade",
+    transition_sequence: Optional[Sequence[str]] = None,
 ):
-    """Create a MoviePy video clip from the provided image paths."""
+    """Create a MoviePy video clip from uniformly sized, normalized frames.
+
+    Image ``i`` starts at ``i * (frame - transition)``; during the first
+    ``transition`` seconds of each image it is blended with the previous one
+    using the cached maps from :mod:`.transitions`, so each output frame is a
+    single array operation instead of a per-frame composite.
+    """
+
+    from moviepy import VideoClip
+
+    from .transitions import build_transition, transition_for_pair
 
     frame_duration = frame_duration_ms / 1000.0
-    transition_duration = transition_ms / 1000.0
-
-    clips = []
-    total = len(image_files)
-    for index, image_path in enumerate(image_files):
-        logger.info("Adding image %s (%d/%d)", image_path.name, index + 1, total)
-        clip = ImageClip(str(image_path), duration=frame_duration)
-        if transition_duration > 0 and index != 0:
-            clip = clip.with_effects([CrossFadeIn(transition_duration)])
-        clips.append(clip)
-
-    padding = -transition_duration if transition_duration > 0 else 0
-    video_clip = concatenate_videoclips(
-        clips,
-        method="compose",
-        padding=padding,
-    )
-    return video_clip.with_fps(frame_rate)
+    # A transition as long as the frame would leave no time between images.
+    transition_duration = min(transition_ms / 1000.0, frame_duration - 1.0 / frame_rate)
+    transition_frames = max(0, round(transition_duration * frame_rate))
+    step = frame_duration - transition_duration if transition_frames else frame_duration
+    height, width = frames[0].shape[:2]
+    last_index = len(frames) - 1
+
+    blends = []
+    for index in range(last_index):
+        kind = transition_for_pair(index, transition, transition_sequence)
+        logger.info("Transition %d/%d: %s", index + 1, last_index, kind)
+        if transition_frames:
+            blends.append(build_transition(kind, transition_frames, height, width))
+
+    def frame_function(t: float) -> np.ndarray:
+        index = min(int(t / step), last_index)
+        local = t - index * step
+        if index == 0 or not blends or local >= transition_duration:
+            return frames[index]
+        k = min(int(local * frame_rate + 1e-6), transition_frames - 1)
+        return blends[index - 1](frames[index - 1], frames[index], k)
+
+    duration = step * last_index + frame_duration
+    return VideoClip(frame_function=frame_function, duration=duration).with_fps(frame_rate)
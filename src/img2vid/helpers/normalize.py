@@ -0,0 +1,77 @@
+"""Normalize mixed-resolution images onto one fixed canvas before clip assembly."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageColor
+
+logger = logging.getLogger(__name__)
+
+
+def _fit_image(
+    image: Image.Image, canvas_size: Tuple[int, int], fit_mode: str
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Return ``image`` resized/cropped for ``fit_mode`` and its paste offset."""
+
+    canvas_width, canvas_height = canvas_size
+    width, height = image.size
+    width_ratio, height_ratio = canvas_width / width, canvas_height / height
+
+    if fit_mode == "cover":
+        scale = max(width_ratio, height_ratio)
+    elif fit_mode == "pad":
+        scale = min(width_ratio, height_ratio, 1.0)
+    else:
+        scale = min(width_ratio, height_ratio)
+
+    target = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if target != image.size:
+        image = image.resize(target, Image.Resampling.LANCZOS)
+
+    if fit_mode == "cover":
+        left = (target[0] - canvas_width) // 2
+        top = (target[1] - canvas_height) // 2
+        image = image.crop((left, top, left + canvas_width, top + canvas_height))
+        return image, (0, 0)
+
+    return image, ((canvas_width - target[0]) // 2, (canvas_height - target[1]) // 2)
+
+
+def normalize_images(
+    image_files: Sequence[Path],
+    canvas_size: Tuple[int, int],
+    fit_mode: str,
+    background_color: str,
+) -> List[np.ndarray]:
+    """Place every image once onto a ``canvas_size`` RGB frame.
+
+    Each result is a C-contiguous ``uint8`` array of shape ``(height, width, 3)``
+    so later stages can treat all frames as uniform. Transparent regions are
+    flattened onto ``background_color``.
+    """
+
+    # ``ConversionConfig.validate`` has already rejected unknown colors.
+    background = ImageColor.getrgb(background_color)[:3]
+
+    frames = []
+    for image_path in image_files:
+        with Image.open(image_path) as source:
+            has_alpha = "A" in source.getbands() or "transparency" in source.info
+            image = source.convert("RGBA" if has_alpha else "RGB")
+        fitted, offset = _fit_image(image, canvas_size, fit_mode)
+        canvas = Image.new("RGB", canvas_size, background)
+        canvas.paste(fitted, offset, fitted if fitted.mode == "RGBA" else None)
+        frames.append(np.ascontiguousarray(np.asarray(canvas, dtype=np.uint8)))
+
+    logger.info(
+        "Normalized %d image(s) onto a %dx%d canvas (%s)",
+        len(frames),
+        canvas_size[0],
+        canvas_size[1],
+        fit_mode,
+    )
+    return frames
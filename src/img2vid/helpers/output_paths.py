@@ -2,10 +2,115 @@
 
 from __future__ import annotations
 
+import os
+import re
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
 
 DEFAULT_OUTPUT_ROOT = Path("build")
+VERSION_PATTERN = re.compile(r"^v(\d{3,})$")
+
+# Descriptors holding flock reservations, keyed by lock path. The OS drops
+# the lock when the process dies, so a killed render never strands a v###.
+_held_locks: Dict[Path, int] = {}
+_held_locks_guard = threading.Lock()
+
+
+def _reservation_path(output_path: Path) -> Path:
+    return output_path.parent / f".{output_path.name}.lock"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _try_reserve_exclusive(lock_path: Path) -> bool:
+    # Fallback without flock: O_EXCL marker, taken over once its PID is gone.
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                pid = int(lock_path.read_text(encoding="utf-8") or 0)
+            except (OSError, ValueError):
+                return False
+            if pid and _pid_alive(pid):
+                return False
+            lock_path.unlink(missing_ok=True)
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(str(os.getpid()))
+        return True
+    return False
+
+
+def _try_reserve(output_path: Path) -> bool:
+    """Atomically claim ``output_path`` by locking its reservation file."""
+
+    lock_path = _reservation_path(output_path)
+    if fcntl is None:
+        return _try_reserve_exclusive(lock_path)
+
+    with _held_locks_guard:
+        if lock_path in _held_locks:
+            return False
+        while True:
+            fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            # A releaser may have unlinked the file between open and flock;
+            # only a lock on the file still at ``lock_path`` counts.
+            try:
+                current = os.stat(lock_path)
+            except FileNotFoundError:
+                current = None
+            if current is not None and current.st_ino == os.fstat(fd).st_ino:
+                break
+            os.close(fd)
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        _held_locks[lock_path] = fd
+        return True
+
+
+def release_output_path(output_path: Path) -> None:
+    """Drop the reservation taken by :func:`resolve_output_path`, if any."""
+
+    lock_path = _reservation_path(output_path)
+    with _held_locks_guard:
+        fd = _held_locks.pop(lock_path, None)
+        if fcntl is None or fd is not None:
+            lock_path.unlink(missing_ok=True)
+        if fd is not None:
+            os.close(fd)
+
+
+def _latest_version(source_root: Path) -> int:
+    try:
+        with os.scandir(source_root) as entries:
+            versions = [
+                int(match.group(1))
+                for entry in entries
+                if entry.is_dir() and (match := VERSION_PATTERN.match(entry.name))
+            ]
+    except FileNotFoundError:
+        return 0
+    return max(versions, default=0)
 
 
 def resolve_output_path(
@@ -18,8 +123,14 @@ def resolve_output_path(
 ) -> Path:
     """Return an output file path honoring versioned folders.
 
-    The layout is ``<root>/<source-folder>/v###/<basename><ext>`` where
-    ``v###`` is the first version whose target file does not yet exist.
+    The layout is ``<root>/<source-folder>/v###/<basename><ext>``. A single
+    directory scan finds the latest version; it is reused when its target
+    file does not exist yet and nobody holds it, otherwise the next version
+    folder is claimed with an exclusive ``mkdir``. The returned path stays
+    reserved (via an ``flock`` on a ``.<file>.lock`` marker) until
+    :func:`release_output_path` is called or the process exits, so
+    concurrent writers never share a ``v###`` and a killed render does not
+    block its version.
     """
 
     if explicit_output is not None:
@@ -28,11 +139,23 @@ def resolve_output_path(
     root = output_root or DEFAULT_OUTPUT_ROOT
     source_name = input_dir.resolve().name
     base_name = (output_basename or source_name).strip() or source_name
+    source_root = root / source_name
+    file_name = f"{base_name}{extension}"
 
-    version = 1
-    while True:
-        candidate_dir = root / source_name / f"v{version:03d}"
-        candidate_path = candidate_dir / f"{base_name}{extension}"
-        if not candidate_path.exists():
+    version = _latest_version(source_root)
+    if version:
+        candidate_path = source_root / f"v{version:03d}" / file_name
+        if not candidate_path.exists() and _try_reserve(candidate_path):
             return candidate_path
+
+    source_root.mkdir(parents=True, exist_ok=True)
+    while True:
         version += 1
+        candidate_dir = source_root / f"v{version:03d}"
+        try:
+            candidate_dir.mkdir()
+        except FileExistsError:
+            continue
+        candidate_path = candidate_dir / file_name
+        if _try_reserve(candidate_path):
+            return candidate_path
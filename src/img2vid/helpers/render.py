@@ -11,9 +11,18 @@ from typing import Sequence
 from moviepy import concatenate_videoclips
 
 from .audio import attach_audio
+from .checkpoints import config_fingerprint, write_checkpointed_video
 from .config import ConversionConfig
-from .images import build_video_clip, list_image_files
+from .images import (
+    build_video_clip,
+    list_image_files,
+    read_image_sizes,
+    resolve_canvas_size,
+)
+from .normalize import normalize_images
+from .output_paths import release_output_path
 from .overlays import create_text_overlay_clip
+from .streaming import write_streaming_video
 from .tempfiles import temporary_directory
 
 logger = logging.getLogger(__name__)
@@ -40,17 +49,29 @@ def render_video(config: ConversionConfig) -> Path:
         total_images = len(image_files)
         logger.info("Found %d image(s) to process", total_images)
 
+        canvas_size = resolve_canvas_size(
+            read_image_sizes(image_files), config.canvas_width, config.canvas_height
+        )
+        frames = normalize_images(
+            image_files,
+            canvas_size=canvas_size,
+            fit_mode=config.fit_mode,
+            background_color=config.background_color,
+        )
+
         video_clip = build_video_clip(
-            image_files=image_files,
+            frames=frames,
             frame_duration_ms=config.frame_duration_ms,
             transition_ms=config.transition_ms,
             frame_rate=config.frame_rate,
+            transition=config.transition,
+            transition_sequence=config.transition_sequence,
         )
 
         transition_seconds = config.transition_ms / 1000.0
         text_duration_seconds = config.text_duration_ms / 1000.0
 
-        frame_size = video_clip.size
+        frame_size = canvas_size
         tail_fade_seconds = None
 
         start_clip = create_text_overlay_clip(
@@ -104,15 +125,36 @@ def render_video(config: ConversionConfig) -> Path:
         logger.info("Writing video to %s", output_path)
         try:
             with temporary_directory(output_dir) as temp_root:
-                video_clip.write_videofile(
-                    str(output_path),
-                    codec="libx264",
-                    audio_codec="aac" if config.audio_path else None,
-                    fps=config.frame_rate,
-                    preset="medium",
-                    logger=None,
-                    temp_audiofile_path=str(temp_root),
-                )
+                audio_codec = "aac" if config.audio_path else None
+                if config.checkpoint_seconds is not None:
+                    write_checkpointed_video(
+                        video_clip,
+                        output_path,
+                        fingerprint=config_fingerprint(config, image_files),
+                        frame_rate=config.frame_rate,
+                        checkpoint_seconds=config.checkpoint_seconds,
+                        audio_codec=audio_codec,
+                    )
+                elif config.stream_output:
+                    write_streaming_video(
+                        video_clip,
+                        output_path,
+                        frame_rate=config.frame_rate,
+                        audio_codec=audio_codec,
+                        temp_root=temp_root,
+                        segment_seconds=config.segment_seconds,
+                        stream_dir=config.stream_dir,
+                    )
+                else:
+                    video_clip.write_videofile(
+                        str(output_path),
+                        codec="libx264",
+                        audio_codec=audio_codec,
+                        fps=config.frame_rate,
+                        preset="medium",
+                        logger=None,
+                        temp_audiofile_path=str(temp_root),
+                    )
                 final_duration = video_clip.duration or 0.0
         finally:
             if video_clip is not None:
@@ -135,6 +177,7 @@ def render_video(config: ConversionConfig) -> Path:
         error_message = str(exc)
         raise
     finally:
+        release_output_path(output_path)
         end_time = datetime.now(timezone.utc)
         elapsed = (end_time - start_time).total_seconds()
         log_entry = {
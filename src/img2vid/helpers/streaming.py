@@ -0,0 +1,113 @@
+"""Progressive HLS output written while the render is still running."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from .config import ConversionError
+
+logger = logging.getLogger(__name__)
+
+PLAYLIST_NAME = "index.m3u8"
+INIT_SEGMENT_NAME = "init.mp4"
+SEGMENT_PATTERN = "segment_%05d.m4s"
+
+
+def stream_directory(output_path: Path) -> Path:
+    """Return the folder holding the HLS playlist and segments for ``output_path``."""
+
+    return output_path.parent / f"{output_path.stem}.hls"
+
+
+def hls_ffmpeg_params(stream_dir: Path, segment_seconds: float) -> list[str]:
+    """Return ffmpeg output options producing an event playlist of fMP4 segments.
+
+    Keyframes are forced on segment boundaries so every segment is
+    independently decodable, and ``temp_file`` keeps half-written segments
+    out of the playlist that the service is serving.
+    """
+
+    return [
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{segment_seconds})",
+        "-f",
+        "hls",
+        "-hls_time",
+        f"{segment_seconds}",
+        "-hls_list_size",
+        "0",
+        "-hls_playlist_type",
+        "event",
+        "-hls_segment_type",
+        "fmp4",
+        "-hls_fmp4_init_filename",
+        INIT_SEGMENT_NAME,
+        "-hls_segment_filename",
+        str(stream_dir / SEGMENT_PATTERN),
+        "-hls_flags",
+        "independent_segments+temp_file",
+    ]
+
+
+def write_streaming_video(
+    video_clip,
+    output_path: Path,
+    *,
+    frame_rate: int,
+    audio_codec: Optional[str],
+    temp_root: Path,
+    segment_seconds: float,
+    stream_dir: Optional[Path] = None,
+) -> None:
+    """Encode ``video_clip`` as HLS segments, then remux them into ``output_path``.
+
+    Segments go to ``stream_dir`` when given (the caller owns and expires
+    it); otherwise to the ``<stem>.hls`` folder beside the output, which is
+    removed once the MP4 is written so no second copy is left behind.
+    """
+
+    from moviepy.config import FFMPEG_BINARY
+    from moviepy.tools import subprocess_call
+
+    owns_stream_dir = stream_dir is None
+    stream_dir = stream_dir or stream_directory(output_path)
+    stream_dir.mkdir(parents=True, exist_ok=True)
+    playlist_path = stream_dir / PLAYLIST_NAME
+
+    logger.info("Streaming HLS segments to %s", stream_dir)
+    video_clip.write_videofile(
+        str(playlist_path),
+        codec="libx264",
+        audio_codec=audio_codec,
+        fps=frame_rate,
+        preset="medium",
+        logger=None,
+        temp_audiofile_path=str(temp_root),
+        ffmpeg_params=hls_ffmpeg_params(stream_dir, segment_seconds),
+    )
+
+    logger.info("Remuxing HLS segments into %s", output_path)
+    try:
+        subprocess_call(
+            [
+                FFMPEG_BINARY,
+                "-y",
+                "-loglevel",
+                "error",
+                "-i",
+                str(playlist_path),
+                "-c",
+                "copy",
+                "-movflags",
+                "+faststart",
+                str(output_path),
+            ],
+            logger=None,
+        )
+    except OSError as exc:
+        raise ConversionError(f"Failed to remux HLS stream: {exc}") from exc
+    if owns_stream_dir:
+        shutil.rmtree(stream_dir, ignore_errors=True)
@@ -0,0 +1,124 @@
+"""Vectorized transitions built from masks and index maps cached per geometry.
+
+Every transition is described by arrays precomputed once per
+``(kind, frame_count, height, width)``; blending one frame is then a single
+NumPy gather and/or integer lerp between two uniform ``uint8`` frames.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+Blend = Callable[[np.ndarray, np.ndarray, int], np.ndarray]
+
+WEIGHT_SCALE = 256
+WIPE_EDGE_FRACTION = 0.05
+ZOOM_MAX_SCALE = 1.25
+DISSOLVE_SEED = 0x1A2B
+
+
+def _lerp(outgoing: np.ndarray, incoming: np.ndarray, weight) -> np.ndarray:
+    """Blend ``uint8`` frames with an integer weight in ``[0, WEIGHT_SCALE]``."""
+
+    outgoing = outgoing.astype(np.uint16)
+    mixed = outgoing * (WEIGHT_SCALE - weight) + incoming.astype(np.uint16) * weight
+    return (mixed >> 8).astype(np.uint8)
+
+
+def _progress(frame_count: int) -> np.ndarray:
+    # Frame k of n shows the incoming image at weight k / n, matching
+    # MoviePy's CrossFadeIn (which fades from t = 0 up to the duration).
+    return np.arange(frame_count, dtype=np.float64) / frame_count
+
+
+def _weights(values: np.ndarray) -> np.ndarray:
+    return np.rint(np.clip(values, 0.0, 1.0) * WEIGHT_SCALE).astype(np.uint16)
+
+
+def _crossfade(frame_count: int, height: int, width: int) -> Blend:
+    weights = _weights(_progress(frame_count))
+    return lambda outgoing, incoming, k: _lerp(outgoing, incoming, weights[k])
+
+
+def _dissolve(frame_count: int, height: int, width: int) -> Blend:
+    rng = np.random.default_rng(DISSOLVE_SEED)
+    thresholds = rng.integers(0, WEIGHT_SCALE, (height, width, 1), dtype=np.uint16)
+    weights = _weights(_progress(frame_count))
+
+    def blend(outgoing: np.ndarray, incoming: np.ndarray, k: int) -> np.ndarray:
+        return np.where(thresholds < weights[k], incoming, outgoing)
+
+    return blend
+
+
+def _wipe(frame_count: int, height: int, width: int) -> Blend:
+    edge = max(1.0, width * WIPE_EDGE_FRACTION)
+    fronts = _progress(frame_count)[:, None] * (width + edge)
+    columns = np.arange(width, dtype=np.float64)[None, :]
+    # One soft-edged column mask per frame, shaped (n, 1, width, 1).
+    masks = _weights((fronts - columns) / edge)[:, None, :, None]
+    return lambda outgoing, incoming, k: _lerp(outgoing, incoming, masks[k])
+
+
+def _slide(frame_count: int, height: int, width: int) -> Blend:
+    offsets = np.rint(_progress(frame_count) * width).astype(np.intp)
+    # Column maps into the side-by-side pair [outgoing | incoming].
+    columns = offsets[:, None] + np.arange(width, dtype=np.intp)[None, :]
+
+    def blend(outgoing: np.ndarray, incoming: np.ndarray, k: int) -> np.ndarray:
+        return np.concatenate((outgoing, incoming), axis=1)[:, columns[k]]
+
+    return blend
+
+
+def _zoom(frame_count: int, height: int, width: int) -> Blend:
+    progress = _progress(frame_count)
+    scales = 1.0 + (ZOOM_MAX_SCALE - 1.0) * progress
+
+    def index_map(size: int) -> np.ndarray:
+        center = (size - 1) / 2.0
+        positions = np.arange(size, dtype=np.float64)[None, :]
+        source = center + (positions - center) / scales[:, None]
+        return np.clip(np.rint(source), 0, size - 1).astype(np.intp)
+
+    rows, columns = index_map(height), index_map(width)
+    weights = _weights(progress)
+
+    def blend(outgoing: np.ndarray, incoming: np.ndarray, k: int) -> np.ndarray:
+        zoomed = outgoing[rows[k][:, None], columns[k][None, :]]
+        return _lerp(zoomed, incoming, weights[k])
+
+    return blend
+
+
+_BUILDERS = {
+    "crossfade": _crossfade,
+    "dissolve": _dissolve,
+    "wipe": _wipe,
+    "slide": _slide,
+    "zoom": _zoom,
+}
+
+
+@lru_cache(maxsize=32)
+def build_transition(kind: str, frame_count: int, height: int, width: int) -> Blend:
+    """Return the cached blend function for one transition geometry."""
+
+    return _BUILDERS[kind](frame_count, height, width)
+
+
+def transition_for_pair(
+    index: int, default: str, sequence: Optional[Sequence[str]]
+) -> str:
+    """Return the transition between image ``index`` and ``index + 1``.
+
+    ``sequence`` assigns transitions to consecutive pairs and repeats when
+    it is shorter than the slideshow.
+    """
+
+    if sequence:
+        return sequence[index % len(sequence)]
+    return default
@@ -0,0 +1,94 @@
+"""Translate HTTP request payloads into conversion configs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Mapping, Optional, Tuple
+
+from .converter import (
+    DEFAULT_SEGMENT_SECONDS,
+    DEFAULT_TEXT_DURATION_MS,
+    ConversionConfig,
+    release_output_path,
+    resolve_output_path,
+)
+
+TRUE_STRINGS = {"1", "true", "yes", "on"}
+
+
+def _as_bool(value: Any) -> bool:
+    # Form fields and query strings arrive as text; JSON arrives typed.
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    return bool(value)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return int(value) if value not in (None, "") else None
+
+
+def _transition_sequence(value: Any) -> Optional[Tuple[str, ...]]:
+    # Accept a JSON list or a comma-separated form/query value.
+    if isinstance(value, str):
+        value = value.split(",")
+    names = tuple(str(name).strip() for name in value or () if str(name).strip())
+    return names or None
+
+
+def _config_from_payload(
+    payload: Mapping[str, Any], input_dir: Path, output_video: Path
+) -> ConversionConfig:
+    return ConversionConfig(
+        input_dir=input_dir,
+        output_video=output_video,
+        audio_path=Path(payload["audio"]) if payload.get("audio") else None,
+        frame_duration_ms=int(payload.get("frame_duration_ms", 3000)),
+        transition_ms=int(payload.get("transition_ms", 500)),
+        transition=payload.get("transition", "crossfade"),
+        transition_sequence=_transition_sequence(payload.get("transitions")),
+        frame_rate=int(payload.get("frame_rate", 30)),
+        start_text=payload.get("start_text"),
+        end_text=payload.get("end_text"),
+        text_duration_ms=int(payload.get("text_duration_ms", DEFAULT_TEXT_DURATION_MS)),
+        text_font=payload.get("text_font"),
+        text_font_size=int(payload.get("text_font_size", 54)),
+        text_color=payload.get("text_color", "white"),
+        text_bg_color=payload.get("text_bg_color", "#000000"),
+        stream_output=_as_bool(payload.get("stream", False)),
+        segment_seconds=float(payload.get("segment_seconds", DEFAULT_SEGMENT_SECONDS)),
+        checkpoint_seconds=(
+            float(payload["checkpoint_seconds"])
+            if payload.get("checkpoint_seconds")
+            else None
+        ),
+        canvas_width=_optional_int(payload.get("canvas_width")),
+        canvas_height=_optional_int(payload.get("canvas_height")),
+        fit_mode=payload.get("fit_mode", "pad"),
+        background_color=payload.get("background_color", "#000000"),
+    )
+
+
+def build_config(payload: Mapping[str, Any]) -> ConversionConfig:
+    """Return a config for ``payload``, reserving its versioned output path.
+
+    Raises ``KeyError`` when ``input_dir`` is missing; the reservation is
+    released again if any other field fails to parse.
+    """
+
+    input_dir = Path(payload["input_dir"])
+    explicit_output = (
+        Path(payload["output_video"]) if payload.get("output_video") else None
+    )
+    output_video = resolve_output_path(
+        input_dir=input_dir,
+        explicit_output=explicit_output,
+        output_root=Path(payload["output_dir"]) if payload.get("output_dir") else None,
+        output_basename=payload.get("output_name"),
+    )
+
+    try:
+        return _config_from_payload(payload, input_dir, output_video)
+    except Exception:
+        release_output_path(output_video)
+        raise
+
@@ -0,0 +1,103 @@
+"""Streaming render jobs kept on disk so every service worker can serve them."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOB_FILE_NAME = "job.json"
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+SWEEP_INTERVAL_SECONDS = 60.0
+
+
+class StreamJobStore:
+    """Job status files and HLS folders under a root shared by all workers.
+
+    Each job lives in ``<root>/<job_id>/``: the playlist and segments plus a
+    ``job.json`` status file. Nothing is held in process memory, so any
+    worker pointed at the same root answers status and segment requests. A
+    job folder expires once nothing in it has changed for ``ttl_seconds``,
+    which covers both finished jobs and jobs whose worker died.
+    """
+
+    def __init__(self, root: Path, ttl_seconds: float) -> None:
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self._last_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def create(self) -> Tuple[str, Path]:
+        """Allocate a job folder and mark the job as running."""
+
+        self.sweep()
+        job_id = uuid.uuid4().hex
+        directory = self.root / job_id
+        directory.mkdir(parents=True)
+        self.update(job_id, status="running")
+        return job_id, directory
+
+    def directory(self, job_id: str) -> Optional[Path]:
+        """Return the folder of a known job, or ``None``."""
+
+        if not JOB_ID_PATTERN.match(job_id):
+            return None
+        directory = self.root / job_id
+        return directory if (directory / JOB_FILE_NAME).is_file() else None
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the status of ``job_id`` as last written by its worker."""
+
+        self.sweep()
+        directory = self.directory(job_id)
+        if directory is None:
+            return None
+        try:
+            return json.loads((directory / JOB_FILE_NAME).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Merge ``fields`` into the job's status file, replacing it atomically."""
+
+        directory = self.root / job_id
+        job = self.get(job_id) or {}
+        job.update(fields, job_id=job_id)
+        staging = directory / f".{JOB_FILE_NAME}.{os.getpid()}.tmp"
+        staging.write_text(json.dumps(job), encoding="utf-8")
+        staging.replace(directory / JOB_FILE_NAME)
+
+    def sweep(self) -> None:
+        """Remove job folders idle for longer than the TTL (at most once a minute)."""
+
+        now = time.time()
+        with self._sweep_lock:
+            if now - self._last_sweep < SWEEP_INTERVAL_SECONDS:
+                return
+            self._last_sweep = now
+
+        try:
+            entries = [entry for entry in os.scandir(self.root) if entry.is_dir()]
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if not JOB_ID_PATTERN.match(entry.name):
+                continue
+            try:
+                with os.scandir(entry.path) as files:
+                    mtimes = [item.stat().st_mtime for item in files]
+                last_activity = max(mtimes, default=entry.stat().st_mtime)
+            except FileNotFoundError:
+                continue
+            if now - last_activity > self.ttl_seconds:
+                logger.info("Removing expired stream job %s", entry.name)
+                shutil.rmtree(entry.path, ignore_errors=True)
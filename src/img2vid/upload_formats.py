@@ -0,0 +1,107 @@
+"""Upload body formats (multipart, tar, zip) unpacked into an upload spool."""
+
+from __future__ import annotations
+
+import itertools
+import tarfile
+import zipfile
+from typing import IO, TYPE_CHECKING, Optional
+
+from werkzeug.sansio.multipart import (
+    Data,
+    Epilogue,
+    Field,
+    File,
+    MultipartDecoder,
+    NeedData,
+)
+
+from .uploads import UploadError, read_chunks
+
+if TYPE_CHECKING:
+    from .uploads import SpooledFile, UploadSpool
+
+MAX_FIELD_BYTES = 64 * 1024
+
+
+def ingest_multipart(spool: "UploadSpool", stream: IO[bytes], boundary: bytes) -> None:
+    """Decode a ``multipart/form-data`` body incrementally into ``spool``."""
+
+    decoder = MultipartDecoder(boundary)
+    target: Optional[SpooledFile] = None
+    field: Optional[Field] = None
+    value = b""
+    event = None
+    try:
+        # A trailing ``None`` tells the decoder the body is complete.
+        for chunk in itertools.chain(read_chunks(stream, spool.chunk_size), [None]):
+            decoder.receive_data(chunk)
+            event = decoder.next_event()
+            while not isinstance(event, (Epilogue, NeedData)):
+                if isinstance(event, File):
+                    spool.count_member()
+                    field, target = None, spool.open(event.filename, event.name)
+                elif isinstance(event, Field):
+                    field, target, value = event, None, b""
+                elif isinstance(event, Data):
+                    if target is not None:
+                        target.write(event.data)
+                    elif field is not None:
+                        value += event.data
+                        if len(value) > MAX_FIELD_BYTES:
+                            raise UploadError(f"Form field too large: {field.name}")
+                    if not event.more_data:
+                        if target is not None:
+                            target.close()
+                        elif field is not None:
+                            spool.fields[field.name] = value.decode("utf-8", "replace")
+                        field, target = None, None
+                event = decoder.next_event()
+    except ValueError as exc:
+        # The decoder raises ValueError on malformed or truncated bodies.
+        raise UploadError(f"Invalid multipart upload: {exc}") from exc
+    finally:
+        if target is not None:
+            target.handle.close()
+    if not isinstance(event, Epilogue):
+        raise UploadError("Invalid multipart upload: missing final boundary")
+
+
+def ingest_tar(spool: "UploadSpool", stream: IO[bytes]) -> None:
+    """Stream a (optionally compressed) tar body into ``spool``."""
+
+    try:
+        with tarfile.open(fileobj=stream, mode="r|*") as archive:
+            for member in archive:
+                spool.count_member()
+                source = archive.extractfile(member) if member.isfile() else None
+                if source is not None:
+                    spool.copy(member.name, source)
+    except tarfile.TarError as exc:
+        raise UploadError(f"Invalid tar upload: {exc}") from exc
+
+
+def ingest_zip(spool: "UploadSpool", stream: IO[bytes]) -> None:
+    """Spool a zip body to disk, then unpack it into ``spool``."""
+
+    # Zip keeps its index at the end, so the body is spooled to disk first;
+    # the compressed bytes count against the same upload budget.
+    archive_path = spool.directory / "upload.zip"
+    try:
+        with archive_path.open("wb") as handle:
+            for chunk in read_chunks(stream, spool.chunk_size):
+                spool.charge(len(chunk))
+                handle.write(chunk)
+        with zipfile.ZipFile(archive_path) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            for _ in members:
+                spool.count_member()
+            # Declared sizes can lie, so writes are still capped as they land.
+            spool.reserve(sum(info.file_size for info in members))
+            for info in members:
+                with archive.open(info) as source:
+                    spool.copy(info.filename, source)
+    except zipfile.BadZipFile as exc:
+        raise UploadError(f"Invalid zip upload: {exc}") from exc
+    finally:
+        archive_path.unlink(missing_ok=True)
@@ -0,0 +1,173 @@
+"""Streaming ingestion of uploaded images and audio into a per-job spool."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO, BinaryIO, Callable, Dict, Iterator, Optional
+
+from werkzeug.utils import secure_filename
+
+from .converter import SUPPORTED_IMAGE_EXTENSIONS, ConversionError
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {".aac", ".flac", ".m4a", ".mp3", ".ogg", ".wav"}
+IMAGE_SIGNATURES = {
+    ".jpg": b"\xff\xd8\xff",
+    ".jpeg": b"\xff\xd8\xff",
+    ".png": b"\x89PNG\r\n\x1a\n",
+}
+TAR_MIMETYPES = {"application/x-tar", "application/gzip", "application/x-gtar"}
+ZIP_MIMETYPES = {"application/zip", "application/x-zip-compressed"}
+DEFAULT_MAX_UPLOAD_BYTES = 2 * 1024**3
+DEFAULT_MAX_UPLOAD_MEMBERS = 2000
+
+
+class UploadError(ConversionError):
+    """Raised when an upload is malformed or contains invalid media."""
+
+
+def read_chunks(stream: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+class SpooledFile:
+    """Write one uploaded file to disk, validating image headers as bytes land."""
+
+    def __init__(self, path: Path, charge: Callable[[int], None]) -> None:
+        self.path = path
+        self.charge = charge
+        self.signature = IMAGE_SIGNATURES.get(path.suffix.lower())
+        self.head = b""
+        try:
+            self.handle: BinaryIO = path.open("xb")
+        except FileExistsError as exc:
+            raise UploadError(f"Duplicate upload file name: {path.name}") from exc
+
+    def __enter__(self) -> "SpooledFile":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        # Closing twice is harmless; this only matters on error paths.
+        self.handle.close()
+
+    def write(self, data: bytes) -> None:
+        try:
+            self.charge(len(data))
+            if self.signature is not None and len(self.head) < len(self.signature):
+                self.head += data[: len(self.signature)]
+                if not self.signature.startswith(self.head[: len(self.signature)]):
+                    raise UploadError(
+                        f"{self.path.name} is not a valid {self.path.suffix} image"
+                    )
+            self.handle.write(data)
+        except BaseException:
+            self.handle.close()
+            raise
+
+    def close(self) -> None:
+        self.handle.close()
+        if self.signature is None:
+            return
+
+        from PIL import Image
+
+        try:
+            # Opening parses the header only; pixel data is decoded at render time.
+            Image.open(self.path).close()
+        except OSError as exc:
+            raise UploadError(f"Unreadable image {self.path.name}: {exc}") from exc
+
+
+class UploadSpool:
+    """Per-job spool directory receiving uploads in bounded chunks.
+
+    Images land in ``images_dir`` (named after the upload so versioned
+    output folders stay meaningful) and the soundtrack in ``audio_path``.
+    Nothing is buffered whole in memory: multipart parts and tar members are
+    copied chunk by chunk, and image signatures are checked on the first
+    bytes of each file while the rest of the body is still arriving. Bytes
+    written to disk and files/members seen are capped at ``max_bytes`` and
+    ``max_members``, so a small compressed archive cannot fill the volume.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        name: str,
+        chunk_size: int,
+        max_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+        max_members: int = DEFAULT_MAX_UPLOAD_MEMBERS,
+    ) -> None:
+        root.mkdir(parents=True, exist_ok=True)
+        self.directory = Path(tempfile.mkdtemp(prefix="upload-", dir=root))
+        self.images_dir = self.directory / (secure_filename(name) or "upload")
+        self.images_dir.mkdir()
+        self.audio_path: Optional[Path] = None
+        self.fields: Dict[str, str] = {}
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.max_members = max_members
+        self.bytes_written = 0
+        self.members = 0
+
+    def reserve(self, size: int) -> None:
+        """Fail early if ``size`` more bytes would exceed the upload budget."""
+
+        if self.bytes_written + size > self.max_bytes:
+            raise UploadError(f"Upload exceeds the {self.max_bytes} byte limit")
+
+    def charge(self, size: int) -> None:
+        self.reserve(size)
+        self.bytes_written += size
+
+    def count_member(self) -> None:
+        self.members += 1
+        if self.members > self.max_members:
+            raise UploadError(f"Upload has more than {self.max_members} files")
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def open(self, filename: str, field: Optional[str] = None) -> Optional[SpooledFile]:
+        safe_name = secure_filename(Path(filename).name)
+        suffix = Path(safe_name).suffix.lower()
+        if field == "audio" or (field is None and suffix in AUDIO_EXTENSIONS):
+            if self.audio_path is not None:
+                raise UploadError("Only one audio file may be uploaded")
+            self.audio_path = self.directory / f"audio{suffix}"
+            return SpooledFile(self.audio_path, self.charge)
+        if suffix in SUPPORTED_IMAGE_EXTENSIONS:
+            return SpooledFile(self.images_dir / safe_name, self.charge)
+        logger.info("Ignoring unsupported upload member: %s", filename)
+        return None
+
+    def copy(self, filename: str, source: IO[bytes]) -> None:
+        target = self.open(filename)
+        if target is None:
+            return
+        with target:
+            for chunk in read_chunks(source, self.chunk_size):
+                target.write(chunk)
+            target.close()
+
+    def ingest(self, stream: IO[bytes], mimetype: str, boundary: Optional[str]) -> None:
+        """Dispatch on the request body type and spool its contents."""
+
+        from .upload_formats import ingest_multipart, ingest_tar, ingest_zip
+
+        if mimetype == "multipart/form-data" and boundary:
+            ingest_multipart(self, stream, boundary.encode("latin-1"))
+        elif mimetype in TAR_MIMETYPES:
+            ingest_tar(self, stream)
+        elif mimetype in ZIP_MIMETYPES:
+            ingest_zip(self, stream)
+        else:
+            raise UploadError(f"Unsupported upload content type: {mimetype or 'none'}")
+
+        if not any(self.images_dir.iterdir()):
+            raise UploadError("Upload did not contain any supported images")